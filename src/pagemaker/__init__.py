@@ -1,5 +1,6 @@
 from .parser import (
     parse_org as parse_org,
+    parse_org_string as parse_org_string,
     parse_area as parse_area,
     slugify as slugify,
     DEFAULTS as DEFAULTS,
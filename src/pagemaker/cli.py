@@ -22,8 +22,6 @@ import subprocess
 import sys
 import tempfile
 import time
-import urllib.parse
-import urllib.request
 from typing import Any, List
 
 from . import adjust_asset_paths, generate_typst, parse_org, update_html_total
@@ -59,6 +57,10 @@ def _get_google_fonts_api_data() -> dict:
 
     # Fetch from Google Fonts API
     api_url = 'https://www.googleapis.com/webfonts/v1/webfonts?sort=popularity'
+    # Deferred: urllib.request pulls in http.client/ssl/email, which only the
+    # font download paths need
+    import urllib.request
+
     try:
         with urllib.request.urlopen(api_url, timeout=10) as response:
             data = json.loads(response.read().decode('utf-8'))
@@ -119,6 +121,8 @@ def _get_google_fonts_api_data() -> dict:
 
 def _download_font_file(url: str, dest_path: pathlib.Path) -> bool:
     """Download a font file from URL to destination"""
+    import urllib.request
+
     try:
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -944,9 +948,13 @@ def cmd_pdf(args):
         sys.exit(1)
 
 
+def ir_command(org_path: str) -> dict:
+    """Build the IR for an org file (the data behind the `ir` subcommand)"""
+    return parse_org(org_path)
+
+
 def cmd_ir(args):
-    ir = parse_org(args.org)
-    print(json.dumps(ir, indent=2))
+    print(json.dumps(ir_command(args.org), indent=2))
 
 
 def cmd_validate(args):
@@ -1,5 +1,7 @@
+import json
+import os
 import pathlib
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 
 def _format_size(size_bytes: int) -> str:
@@ -162,10 +164,71 @@ def _get_project_fonts() -> Dict:
     return _discover_fonts_in_path(assets_fonts)
 
 
+def _get_font_names_cache_path() -> Optional[pathlib.Path]:
+    """Get path to the per-file font family name cache.
+    Returns None when PAGEMAKER_NO_FONT_CACHE is set, disabling the on-disk cache.
+    """
+    no_cache = str(os.environ.get('PAGEMAKER_NO_FONT_CACHE', '')).strip().lower()
+    if no_cache not in ('', '0', 'false', 'no'):
+        return None
+    cache_dir = pathlib.Path.home() / '.pagemaker' / 'cache'
+    return cache_dir / 'font_names.json'
+
+
+def _load_font_names_cache(cache_path: pathlib.Path) -> Dict:
+    """Load cached font names keyed by file path. Returns empty dict on any failure."""
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_font_names_cache(cache_path: pathlib.Path, entries: Dict) -> None:
+    """Persist font names cache"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(entries), encoding='utf-8')
+    except Exception:
+        # Cache failures shouldn't break functionality
+        pass
+
+
+def _read_font_family_names(f: pathlib.Path, TTFont, TTCollection) -> List[str]:
+    """Read family names (nameID 1 and 16) from a single TTF/OTF/TTC/OTC file."""
+    names: List[str] = []
+
+    def add_names(font) -> None:
+        nm = font.get('name')
+        if not nm:
+            return
+        for rec in nm.names:
+            if rec.nameID in (1, 16):
+                try:
+                    names.append(rec.toUnicode().strip())
+                except Exception:
+                    pass
+
+    if f.suffix.lower() in {'.ttc', '.otc'}:
+        tc = TTCollection(str(f))
+        for ttf in tc.fonts:
+            add_names(ttf)
+    else:
+        t = TTFont(str(f), lazy=True)
+        add_names(t)
+        try:
+            t.close()
+        except Exception:
+            pass
+    return names
+
+
 def _collect_real_font_names(paths: List[str]) -> Set[str]:
     """Collect real font family names via fontTools (with TTC support).
     Returns a set of family names found across provided paths. Empty set when fontTools missing.
     Only TTF/OTF/TTC/OTC are considered (Typst-usable font formats).
+    Parsed names are cached on disk per file and reused while the file's mtime and size match;
+    entries for files that no longer exist are pruned.
     """
     names: Set[str] = set()
     try:
@@ -174,6 +237,13 @@ def _collect_real_font_names(paths: List[str]) -> Set[str]:
     except Exception:
         return names
     font_exts = {'.ttf', '.otf', '.ttc', '.otc'}
+    cache_path = _get_font_names_cache_path()
+    cache = _load_font_names_cache(cache_path) if cache_path is not None else {}
+    # Drop entries for fonts that have since been deleted or moved
+    stale = [key for key in cache if not pathlib.Path(key).is_file()]
+    for key in stale:
+        del cache[key]
+    cache_dirty = bool(stale)
     for p in paths:
         try:
             root = pathlib.Path(p)
@@ -183,34 +253,28 @@ def _collect_real_font_names(paths: List[str]) -> Set[str]:
                 try:
                     if not f.is_file() or f.suffix.lower() not in font_exts:
                         continue
-                    if f.suffix.lower() in {'.ttc', '.otc'}:
-                        tc = TTCollection(str(f))
-                        for ttf in tc.fonts:
-                            nm = ttf.get('name')
-                            if not nm:
-                                continue
-                            for rec in nm.names:
-                                if rec.nameID in (1, 16):
-                                    try:
-                                        names.add(rec.toUnicode().strip())
-                                    except Exception:
-                                        pass
-                    else:
-                        t = TTFont(str(f), lazy=True)
-                        nm = t.get('name')
-                        if nm:
-                            for rec in nm.names:
-                                if rec.nameID in (1, 16):
-                                    try:
-                                        names.add(rec.toUnicode().strip())
-                                    except Exception:
-                                        pass
-                        try:
-                            t.close()
-                        except Exception:
-                            pass
+                    st = f.stat()
+                    key = str(f.resolve())
+                    entry = cache.get(key)
+                    if (
+                        isinstance(entry, dict)
+                        and entry.get('mtime_ns') == st.st_mtime_ns
+                        and entry.get('size') == st.st_size
+                    ):
+                        names.update(entry.get('names', []))
+                        continue
+                    file_names = _read_font_family_names(f, TTFont, TTCollection)
+                    cache[key] = {
+                        'mtime_ns': st.st_mtime_ns,
+                        'size': st.st_size,
+                        'names': file_names,
+                    }
+                    cache_dirty = True
+                    names.update(file_names)
                 except Exception:
                     continue
         except Exception:
             continue
+    if cache_dirty and cache_path is not None:
+        _save_font_names_cache(cache_path, cache)
     return {n for n in names if n}
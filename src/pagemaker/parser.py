@@ -1,3 +1,4 @@
+import io
 import re
 import warnings
 from typing import Dict, List, Optional
@@ -18,6 +19,9 @@ DESC_RE = re.compile(r'^(\s*)(.+?)\s*::\s*(.*)$')
 TABLE_LINE_RE = re.compile(r'^\s*\|.*\|\s*$')
 TABLE_SEP_RE = re.compile(r'^\s*\|[\-+:\s]+\|\s*$')
 
+# AREA cell regex (A1 notation: row letters + column number, optional `$` absolute markers)
+AREA_CELL_RE = re.compile(r'^\s*\$?([A-Za-z]+)\s*\$?(\d+)\s*$')
+
 PAGE_SIZES_MM = {
     'A4': (210, 297),
     'A3': (297, 420),
@@ -797,49 +801,42 @@ class OrgPage:
         }
 
 
+def _letters_to_row(letters: str) -> int:
+    """Convert spreadsheet-style row letters to a 1-based index (A=1, Z=26, AA=27)."""
+    n = 0
+    for ch in letters.upper():
+        n = n * 26 + (ord(ch) - 64)
+    return n
+
+
+def _parse_cell(val: str) -> Optional[tuple[int, int]]:
+    """Parse a single A1-style cell into (row, col), or None if it is not a cell."""
+    m = AREA_CELL_RE.match(val)
+    if not m:
+        return None
+    return _letters_to_row(m.group(1)), int(m.group(2))
+
+
 def parse_area(val):
     val = (val or "").strip()
     # Support new RowCol notation where rows are letters from top (A=1) and columns are numbers.
     # Examples:
     #  - "A1" -> [1,1,1,1]
     #  - "A1,C2" -> rectangle from A1 to C2 inclusive -> [1,1,2,3]
+    #  - "$A$1" -> same as "A1" (spreadsheet-style absolute markers are accepted and ignored)
     # Backward-compatible with legacy "x,y,w,h" integer format.
-    cell_re = re.compile(r'^\s*([A-Za-z]+)\s*(\d+)\s*$')
-    block_re = re.compile(r'^\s*([A-Za-z]+)\s*(\d+)\s*,\s*([A-Za-z]+)\s*(\d+)\s*$')
-
-    def letters_to_num(s: str):
-        n = 0
-        s = s.strip().upper()
-        if not s:
-            return None
-        for ch in s:
-            if 'A' <= ch <= 'Z':
-                n = n * 26 + (ord(ch) - ord('A') + 1)
-            else:
-                return None
-        return n if n > 0 else None
-
-    mb = block_re.match(val)
-    if mb:
-        r1 = letters_to_num(mb.group(1))
-        c1 = int(mb.group(2))
-        r2 = letters_to_num(mb.group(3))
-        c2 = int(mb.group(4))
-        if r1 and r2:
-            x = min(c1, c2)
-            y = min(r1, r2)
-            w = abs(c2 - c1) + 1
-            h = abs(r2 - r1) + 1
-            return [x, y, w, h]
-        return None
-
-    mc = cell_re.match(val)
-    if mc:
-        r = letters_to_num(mc.group(1))
-        c = int(mc.group(2))
-        if r:
-            return [c, r, 1, 1]
-        return None
+    first, sep, rest = val.partition(',')
+    if sep and ',' not in rest:
+        start = _parse_cell(first)
+        end = _parse_cell(rest) if start else None
+        if start and end:
+            (r1, c1), (r2, c2) = start, end
+            return [min(c1, c2), min(r1, r2), abs(c2 - c1) + 1, abs(r2 - r1) + 1]
+
+    cell = _parse_cell(val)
+    if cell:
+        r, c = cell
+        return [c, r, 1, 1]
 
     # Legacy x,y,w,h format
     try:
@@ -883,7 +880,22 @@ def parse_org(path):
         dict: Intermediate representation containing 'meta' and 'pages' keys
     """
     with open(path, encoding='utf-8') as f:
-        lines = f.readlines()
+        return parse_org_string(f.read())
+
+
+def parse_org_string(text: str):
+    """Parse org-mode source held in memory into intermediate representation.
+
+    Same as parse_org() but without touching the filesystem. Line endings are
+    normalized the way reading the file in text mode would.
+
+    Args:
+        text: Org-mode source text
+
+    Returns:
+        dict: Intermediate representation containing 'meta' and 'pages' keys
+    """
+    lines = io.StringIO(text, newline=None).readlines()
     meta = {}
     pages: List[OrgPage] = []
     current_page: Optional[OrgPage] = None
@@ -1109,6 +1121,7 @@ def parse_org(path):
     close_element()
 
     # Filter out ignored pages entirely
-    pages_ir = [p.to_ir(meta_defaults(meta)) for p in pages if not getattr(p, 'ignore_page', False)]
+    defaults = meta_defaults(meta)
+    pages_ir = [p.to_ir(defaults) for p in pages if not getattr(p, 'ignore_page', False)]
     ir = {'meta': meta, 'pages': pages_ir}
     return ir
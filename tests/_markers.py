@@ -0,0 +1,13 @@
+"""Shared test decorators.
+
+``slow`` marks integration tests that launch the CLI or external tools in
+subprocesses. Set ``PAGEMAKER_SKIP_SLOW=1`` to skip them for a fast inner loop
+(``make test-fast``).
+"""
+
+import os
+import unittest
+
+SKIP_SLOW = os.environ.get('PAGEMAKER_SKIP_SLOW', '') not in ('', '0')
+
+slow = unittest.skipIf(SKIP_SLOW, 'slow test; unset PAGEMAKER_SKIP_SLOW to run')
@@ -0,0 +1,30 @@
+"""Shared filesystem locations and CLI subprocess environment for the test suite.
+
+Computed once at import time. Importing this module also puts ``src/`` on
+``sys.path`` so tests can ``import pagemaker`` without an installed package,
+and disables the on-disk font name cache for the test process and its CLI
+subprocesses; the ``tests.unit`` and ``tests.integration`` packages import it
+for that reason.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / 'src'
+FIXTURES = PROJECT_ROOT / 'tests' / 'fixtures'
+
+# Keep test builds, in-process or not, from writing the font name cache under $HOME
+os.environ.setdefault('PAGEMAKER_NO_FONT_CACHE', '1')
+
+# Environment for `python -m pagemaker.cli` subprocesses: src/ first on PYTHONPATH and
+# no .pyc writes. Shared read-only; merge into a new dict when a test needs extra keys.
+CLI_ENV = {
+    **os.environ,
+    'PYTHONPATH': str(SRC_PATH) + os.pathsep + os.environ.get('PYTHONPATH', ''),
+    'PYTHONDONTWRITEBYTECODE': '1',
+}
+
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
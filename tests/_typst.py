@@ -0,0 +1,62 @@
+"""Helpers for tests that inspect generated Typst.
+
+``assert_all_in`` checks several substrings and reports every missing one together.
+
+``page_contents`` / ``extract_page_content`` slice out the per-page content between the
+generator's markers.
+
+``two_pdf_scales`` reads the scales of the two ``dummy.pdf`` embeds the PDF fit tests emit.
+"""
+
+import re
+
+
+def assert_all_in(haystack: str, *needles: str) -> None:
+    """Assert every needle occurs in haystack, reporting all missing ones at once"""
+    missing = [n for n in needles if n not in haystack]
+    if missing:
+        raise AssertionError('Missing from output:\n' + '\n'.join(f'  {n!r}' for n in missing))
+
+
+_BEGIN_PAGE = 'BEGIN PAGE CONTENT'
+_END_PAGE = 'END PAGE CONTENT'
+
+
+def page_contents(typst: str) -> list:
+    """Return the text between each BEGIN/END PAGE CONTENT marker pair, one item per page.
+
+    Template helpers sit outside the markers, so assertions on the result only see
+    emitted page content. Raises AssertionError when no marker pair is present.
+    """
+    parts = []
+    pos = typst.find(_BEGIN_PAGE)
+    if pos == -1:
+        raise AssertionError(f'No {_BEGIN_PAGE!r} marker in Typst output')
+    while pos != -1:
+        # Content starts on the line after the marker
+        start = typst.find('\n', pos) + 1
+        end = typst.find(_END_PAGE, start)
+        if not start or end == -1:
+            raise AssertionError(f'Unterminated {_BEGIN_PAGE!r} block in Typst output')
+        # Stop before the END marker's line (it carries a '// ' comment prefix)
+        nl = typst.rfind('\n', start, end)
+        parts.append(typst[start:nl] if nl != -1 else '')
+        pos = typst.find(_BEGIN_PAGE, end)
+    return parts
+
+
+def extract_page_content(typst: str) -> str:
+    """Return the content of every page (see ``page_contents``) joined by newlines"""
+    return '\n'.join(page_contents(typst))
+
+
+# Scale multiplier emitted for the dummy PDF embeds
+PDF_SCALE_RE = re.compile(r'PdfEmbed\("dummy\.pdf", page: 1, scale: ([0-9.]+)\)')
+
+
+def two_pdf_scales(typst: str) -> tuple:
+    """Return the two PdfEmbed scales in typst, asserting there are exactly two"""
+    it = PDF_SCALE_RE.finditer(typst)
+    first, second, extra = next(it, None), next(it, None), next(it, None)
+    assert first and second and extra is None, 'expected exactly two PdfEmbed scales'
+    return float(first.group(1)), float(second.group(1))
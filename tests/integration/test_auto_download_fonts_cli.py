@@ -6,8 +6,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+from tests._markers import slow
+from tests._paths import CLI_ENV, PROJECT_ROOT, SRC_PATH
 
 TEST_FONT = 'Zzz Totally Missing Font'
 
@@ -27,13 +27,11 @@ def _download_full_family(font_family: str, force: bool = False):
 """
 
 
+@slow
 class TestAutoDownloadFontsCLI(unittest.TestCase):
     def _run_cli(self, args, extra_env=None, expect_success=True):
         cmd = [sys.executable, '-m', 'pagemaker.cli'] + args
-        env = os.environ.copy()
-        env['PYTHONPATH'] = SRC_PATH + os.pathsep + env.get('PYTHONPATH', '')
-        if extra_env:
-            env.update(extra_env)
+        env = {**CLI_ENV, **extra_env} if extra_env else CLI_ENV
         res = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
         if expect_success and res.returncode != 0:
             self.fail(f"Command failed {cmd}\nSTDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}")
@@ -49,7 +47,7 @@ class TestAutoDownloadFontsCLI(unittest.TestCase):
             (pkg_dir / 'cli.py').write_text(FAKE_FD_CODE, encoding='utf-8')
 
             # Ensure target font directory is absent to trigger auto-download
-            target_dir = Path(PROJECT_ROOT) / 'assets' / 'fonts' / TEST_FONT
+            target_dir = PROJECT_ROOT / 'assets' / 'fonts' / TEST_FONT
             if target_dir.exists():
                 import shutil
 
@@ -66,7 +64,7 @@ class TestAutoDownloadFontsCLI(unittest.TestCase):
             extra_env = {
                 'PYTHONPATH': str(td_path)
                 + os.pathsep
-                + SRC_PATH
+                + str(SRC_PATH)
                 + os.pathsep
                 + os.environ.get('PYTHONPATH', ''),
                 'PAGEMAKER_DISABLE_FONTTOOLS': '1',
@@ -80,7 +78,7 @@ class TestAutoDownloadFontsCLI(unittest.TestCase):
             self.assertIn('Missing fonts detected', out)
             self.assertIn(f"'{TEST_FONT}' is now available", out)
             # Ensure font directory was created
-            self.assertTrue((Path(PROJECT_ROOT) / 'assets' / 'fonts' / TEST_FONT).exists())
+            self.assertTrue((PROJECT_ROOT / 'assets' / 'fonts' / TEST_FONT).exists())
 
             # Second run: validate fonts strictly should pass now
             res2 = self._run_cli(
@@ -97,7 +95,3 @@ class TestAutoDownloadFontsCLI(unittest.TestCase):
                 extra_env=extra_env,
             )
             self.assertIn('Built Typst', res2.stdout)
-
-
-if __name__ == '__main__':
-    unittest.main()
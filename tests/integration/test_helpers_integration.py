@@ -8,7 +8,6 @@
 """
 
 import io
-import os
 import subprocess
 import sys
 import tempfile
@@ -16,12 +15,11 @@ import unittest
 from contextlib import redirect_stderr
 from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-SRC_PATH = PROJECT_ROOT / 'src'
-EXAMPLES_DIR = PROJECT_ROOT / 'examples'
+import pagemaker as pm
+from tests._markers import slow
+from tests._paths import CLI_ENV, PROJECT_ROOT
 
-sys.path.insert(0, str(SRC_PATH))
-import pagemaker as pm  # noqa: E402
+EXAMPLES_DIR = PROJECT_ROOT / 'examples'
 
 
 def _has_typst_and_muchpdf() -> bool:
@@ -41,7 +39,7 @@ def _has_typst_and_muchpdf() -> bool:
                     'typst',
                     'compile',
                     '--root',
-                    str(PROJECT_ROOT.resolve()),
+                    str(PROJECT_ROOT),
                     str(typ_path),
                     str(out_pdf),
                 ],
@@ -53,6 +51,7 @@ def _has_typst_and_muchpdf() -> bool:
         return False
 
 
+@slow
 class TestHelpersIntegration(unittest.TestCase):
     def test_sample_org_has_footer_and_no_area_warnings(self):
         sample_org = EXAMPLES_DIR / 'sample.org'
@@ -97,17 +96,11 @@ class TestHelpersIntegration(unittest.TestCase):
                 'out.pdf',
                 '--no-clean',
             ]
-            env = os.environ.copy()
-            env['PYTHONPATH'] = str(SRC_PATH) + os.pathsep + env.get('PYTHONPATH', '')
             res = subprocess.run(
-                cmd, cwd=str(PROJECT_ROOT), env=env, capture_output=True, text=True
+                cmd, cwd=str(PROJECT_ROOT), env=CLI_ENV, capture_output=True, text=True
             )
             if res.returncode != 0:
                 self.fail(
                     f"CLI PDF compile with helpers failed. STDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}"
                 )
             self.assertTrue((td_path / 'out.pdf').exists())
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -15,10 +15,13 @@ import tempfile
 import unittest
 from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
+from tests._markers import slow
+from tests._paths import PROJECT_ROOT
+
 ASSETS_DIR = PROJECT_ROOT / "examples" / "assets" / "test-pdfs"
 
 
+@slow
 class TestMuchPDFOnAssets(unittest.TestCase):
     def _has_typst_and_muchpdf(self) -> bool:
         """Return True if typst CLI is available and can import MuchPDF."""
@@ -39,7 +42,7 @@ class TestMuchPDFOnAssets(unittest.TestCase):
                         "typst",
                         "compile",
                         "--root",
-                        str(PROJECT_ROOT.resolve()),
+                        str(PROJECT_ROOT),
                         str(typ_path),
                         str(out_pdf),
                     ],
@@ -73,7 +76,7 @@ class TestMuchPDFOnAssets(unittest.TestCase):
                     "typst",
                     "compile",
                     "--root",
-                    str(PROJECT_ROOT.resolve()),
+                    str(PROJECT_ROOT),
                     str(typ_path),
                     str(out_pdf),
                 ],
@@ -122,7 +125,3 @@ class TestMuchPDFOnAssets(unittest.TestCase):
         rc, out, err, _ = self._compile_with_muchpdf(pdf_path.relative_to(PROJECT_ROOT))
         # We assert success here, but the decorator marks this test as expected to fail.
         self.assertEqual(rc, 0, f"Unexpected failure compiling {pdf_path.name}:\nSTDERR:\n{err}")
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -4,17 +4,17 @@ Skips gracefully if `typst` is not installed or the muchpdf package
 is unavailable (e.g., offline environments).
 """
 
-import os
 import subprocess
 import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+from tests._markers import slow
+from tests._paths import CLI_ENV, FIXTURES, PROJECT_ROOT
 
 
+@slow
 class TestPDFCompileCLI(unittest.TestCase):
     def _has_typst_and_muchpdf(self) -> bool:
         try:
@@ -35,7 +35,7 @@ class TestPDFCompileCLI(unittest.TestCase):
                         'typst',
                         'compile',
                         '--root',
-                        str(Path(PROJECT_ROOT).resolve()),
+                        str(PROJECT_ROOT),
                         str(typ_path),
                         str(out_pdf),
                     ],
@@ -49,7 +49,7 @@ class TestPDFCompileCLI(unittest.TestCase):
     def test_cli_pdf_compile_if_available(self):
         if not self._has_typst_and_muchpdf():
             self.skipTest("typst or muchpdf not available; skipping PDF compile test")
-        fixtures = Path(PROJECT_ROOT) / 'tests' / 'fixtures'
+        fixtures = FIXTURES
         org_path = fixtures / 'pdf_test.org'
         with tempfile.TemporaryDirectory() as td:
             cmd = [
@@ -64,13 +64,7 @@ class TestPDFCompileCLI(unittest.TestCase):
                 'out.pdf',
                 '--no-clean',
             ]
-            env = os.environ.copy()
-            env['PYTHONPATH'] = SRC_PATH + os.pathsep + env.get('PYTHONPATH', '')
-            res = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+            res = subprocess.run(cmd, cwd=PROJECT_ROOT, env=CLI_ENV, capture_output=True, text=True)
             if res.returncode != 0:
                 self.fail(f"CLI pdf compile failed. STDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}")
             self.assertTrue((Path(td) / 'out.pdf').exists())
-
-
-if __name__ == '__main__':
-    unittest.main()
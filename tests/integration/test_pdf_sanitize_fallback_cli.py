@@ -11,7 +11,6 @@ The test is skipped if neither `mutool` nor `gs` (Ghostscript) are available,
 because one of them is required to generate the fallback asset.
 """
 
-import os
 import re
 import shutil
 import subprocess
@@ -20,8 +19,9 @@ import tempfile
 import unittest
 from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-SRC_PATH = PROJECT_ROOT / 'src'
+from tests._markers import slow
+from tests._paths import CLI_ENV, PROJECT_ROOT
+
 ASSETS_DIR = PROJECT_ROOT / 'examples' / 'assets' / 'test-pdfs'
 
 
@@ -29,6 +29,7 @@ def _have_tool(name: str) -> bool:
     return shutil.which(name) is not None
 
 
+@slow
 class TestPDFSanitizeFallbackCLI(unittest.TestCase):
     def test_sanitize_then_fallback_rewrites_pdf_to_image_when_compile_fails(self):
         # Require at least one renderer for fallbacks
@@ -63,10 +64,8 @@ class TestPDFSanitizeFallbackCLI(unittest.TestCase):
                 '-o',
                 'deck.typ',
             ]
-            env = os.environ.copy()
-            env['PYTHONPATH'] = str(SRC_PATH) + os.pathsep + env.get('PYTHONPATH', '')
             res = subprocess.run(
-                cmd, cwd=str(PROJECT_ROOT), env=env, capture_output=True, text=True
+                cmd, cwd=str(PROJECT_ROOT), env=CLI_ENV, capture_output=True, text=True
             )
 
             # Compile is expected to fail due to bogus typst, but the .typ should
@@ -89,7 +88,3 @@ class TestPDFSanitizeFallbackCLI(unittest.TestCase):
             fallback_rel = m.group(0)  # relative path inside export dir
             fallback_abs = td_path / fallback_rel
             self.assertTrue(fallback_abs.exists(), f"Fallback asset not created: {fallback_abs}")
-
-
-if __name__ == '__main__':
-    unittest.main()
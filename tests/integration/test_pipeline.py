@@ -2,19 +2,18 @@
 """Integration tests for the full org->typst pipeline"""
 
 import os
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker as pm
+from tests._paths import FIXTURES
 
 
 class TestPipeline(unittest.TestCase):
+    fixtures_path = FIXTURES
+
     def setUp(self):
-        self.fixtures_path = Path(__file__).parent.parent / "fixtures"
         self.temp_dir = tempfile.mkdtemp()
 
     def test_basic_org_to_typst(self):
@@ -59,7 +58,3 @@ class TestPipeline(unittest.TestCase):
         self.assertFalse(os.path.isabs(pdf_el['src']))
         # Path should point back up (likely via ..) from export dir into assets
         self.assertIn('assets', pdf_el['src'])
-
-
-if __name__ == '__main__':
-    unittest.main()
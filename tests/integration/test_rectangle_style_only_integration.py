@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """Integration tests for style-driven rectangles via parse_org -> generate_typst"""
 
-import os
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker as pm
 
 
@@ -63,7 +59,3 @@ class TestRectangleStyleOnlyIntegration(unittest.TestCase):
         typst = pm.generate_typst(ir)
         # Element alpha should override style alpha; stroke from style should be present
         self.assertIn('ColorRect("#123456", 0.3, stroke: 2pt, stroke_color: "#abcdef")', typst)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -10,15 +10,15 @@ Covers:
 - Ignores #+TBLFM lines
 """
 
-import os
 import subprocess
 import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-SRC_PATH = PROJECT_ROOT / 'src'
+from tests._markers import slow
+from tests._paths import CLI_ENV, PROJECT_ROOT
+from tests._typst import extract_page_content
 
 ORG_WITH_TABLE = """#+PAGESIZE: A4
 * Page 1
@@ -56,6 +56,7 @@ ORG_TABLE_WITH_SEPARATORS = """#+PAGESIZE: A4
 """
 
 
+@slow
 class TestTablesCLI(unittest.TestCase):
     def _build_typst(self, org_text: str) -> str:
         with tempfile.TemporaryDirectory() as td:
@@ -73,10 +74,8 @@ class TestTablesCLI(unittest.TestCase):
                 '--output',
                 str(out_typ),
             ]
-            env = os.environ.copy()
-            env['PYTHONPATH'] = str(SRC_PATH) + os.pathsep + env.get('PYTHONPATH', '')
             res = subprocess.run(
-                cmd, cwd=str(PROJECT_ROOT), env=env, capture_output=True, text=True
+                cmd, cwd=str(PROJECT_ROOT), env=CLI_ENV, capture_output=True, text=True
             )
             if res.returncode != 0:
                 raise AssertionError(
@@ -88,19 +87,7 @@ class TestTablesCLI(unittest.TestCase):
     def test_cli_renders_table_end_to_end(self):
         code = self._build_typst(ORG_WITH_TABLE)
         # Extract only page content area to avoid matching helpers
-        lines = code.split('\n')
-        in_content = False
-        content_lines = []
-        for line in lines:
-            if 'BEGIN PAGE CONTENT' in line:
-                in_content = True
-                continue
-            elif 'END PAGE CONTENT' in line:
-                in_content = False
-                continue
-            elif in_content:
-                content_lines.append(line)
-        page_content = '\n'.join(content_lines)
+        page_content = extract_page_content(code)
 
         # Expect a single #table with 3 auto columns and 6pt gutter
         self.assertIn('#table(columns: (auto, auto, auto), gutter: 6pt', page_content)
@@ -129,19 +116,7 @@ class TestTablesCLI(unittest.TestCase):
     def test_cli_table_separators_interior_and_no_trailing(self):
         code = self._build_typst(ORG_TABLE_WITH_SEPARATORS)
         # Extract only page content area to avoid matching helpers
-        lines = code.split('\n')
-        in_content = False
-        content_lines = []
-        for line in lines:
-            if 'BEGIN PAGE CONTENT' in line:
-                in_content = True
-                continue
-            elif 'END PAGE CONTENT' in line:
-                in_content = False
-                continue
-            elif in_content:
-                content_lines.append(line)
-        page_content = '\n'.join(content_lines)
+        page_content = extract_page_content(code)
 
         # Expect header recognized; no implicit top hline
         self.assertNotIn('table.hline(y: 0)', page_content)
@@ -169,19 +144,7 @@ class TestTablesCLI(unittest.TestCase):
 """
         code = self._build_typst(org_text)
         # Extract only page content area to avoid matching helpers
-        lines = code.split('\n')
-        in_content = False
-        content_lines = []
-        for line in lines:
-            if 'BEGIN PAGE CONTENT' in line:
-                in_content = True
-                continue
-            elif 'END PAGE CONTENT' in line:
-                in_content = False
-                continue
-            elif in_content:
-                content_lines.append(line)
-        page_content = '\n'.join(content_lines)
+        page_content = extract_page_content(code)
 
         # No header section should be present
         self.assertNotIn('table.header(', page_content)
@@ -211,19 +174,7 @@ class TestTablesCLI(unittest.TestCase):
 """
         code = self._build_typst(org_text)
         # Extract only page content area to avoid matching helpers
-        lines = code.split('\n')
-        in_content = False
-        content_lines = []
-        for line in lines:
-            if 'BEGIN PAGE CONTENT' in line:
-                in_content = True
-                continue
-            elif 'END PAGE CONTENT' in line:
-                in_content = False
-                continue
-            elif in_content:
-                content_lines.append(line)
-        page_content = '\n'.join(content_lines)
+        page_content = extract_page_content(code)
 
         # Header recognized and bold cells
         self.assertNotIn('table.hline(y: 0)', page_content)
@@ -234,7 +185,3 @@ class TestTablesCLI(unittest.TestCase):
         # With header + 4 data rows and interior separators after row1 and row2:
         # Expect hlines under separators-only: 1 (after header) + 2 extras = 3
         self.assertEqual(page_content.count('table.hline()'), 3)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Integration: the build pipeline emits Typst without nested content blocks like [[#text.
+
+Runs the same parse -> adjust_asset_paths -> generate steps as `pagemaker build`
+in-process and inspects the returned Typst string (no subprocess, no file output).
+"""
+
+import unittest
+
+import pagemaker as pm
+from tests._paths import FIXTURES, PROJECT_ROOT
+from tests._typst import extract_page_content
+
+
+class TestNoNestedBrackets(unittest.TestCase):
+    def test_build_typst_has_no_nested_text_blocks(self):
+        org_path = FIXTURES / 'basic.org'
+        self.assertTrue(org_path.exists(), f"Missing fixture: {org_path}")
+        ir = pm.parse_org(str(org_path))
+        # Mirror cmd_build: rewrite asset paths relative to the (default) export dir
+        pm.adjust_asset_paths(ir, PROJECT_ROOT / 'export')
+        code = pm.generate_typst(ir)
+        self.assertNotIn('[[#text', code)
+
+        # Check for ]]] only in page content, not in template functions
+        page_content = extract_page_content(code)
+        self.assertNotIn(']]]', page_content)
@@ -0,0 +1,2 @@
+# Put src/ on sys.path once for every test module in this package
+from tests import _paths  # noqa: F401
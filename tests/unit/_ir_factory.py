@@ -0,0 +1,25 @@
+"""Factory for the single-page IR shell most generator unit tests start from."""
+
+from types import MappingProxyType
+
+# Shared, read-only page attributes reused by every IR built with the defaults
+_PS_A4 = MappingProxyType({'w_mm': 210.0, 'h_mm': 297.0})
+_GRID_12x8 = MappingProxyType({'cols': 12, 'rows': 8})
+
+
+def single_page_ir(
+    elements, meta=None, *, w_mm=210.0, h_mm=297.0, cols=12, rows=8, title='P'
+) -> dict:
+    """Build ``{'meta': ..., 'pages': [page]}`` with one page holding ``elements``"""
+    if (w_mm, h_mm) == (_PS_A4['w_mm'], _PS_A4['h_mm']):
+        page_size = _PS_A4
+    else:
+        page_size = {'w_mm': w_mm, 'h_mm': h_mm}
+    if (cols, rows) == (_GRID_12x8['cols'], _GRID_12x8['rows']):
+        grid = _GRID_12x8
+    else:
+        grid = {'cols': cols, 'rows': rows}
+    return {
+        'meta': meta if meta is not None else {},
+        'pages': [{'title': title, 'page_size': page_size, 'grid': grid, 'elements': elements}],
+    }
@@ -1,12 +1,8 @@
 #!/usr/bin/env python3
 """Tests for A1-style AREA parsing"""
 
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker as pm
 
 
@@ -33,6 +29,10 @@ class TestA1Area(unittest.TestCase):
         # AZ10 -> row 52, col 10
         self.assertEqual(pm.parse_area("AZ10"), [10, 52, 1, 1])
 
+    def test_absolute_markers_ignored(self):
+        self.assertEqual(pm.parse_area("$A$1"), [1, 1, 1, 1])
+        self.assertEqual(pm.parse_area("$a1,$C$2"), [1, 1, 2, 3])
+
     def test_legacy_numeric_still_supported(self):
         self.assertEqual(pm.parse_area("1,2,3,4"), [1, 2, 3, 4])
 
@@ -42,7 +42,3 @@ class TestA1Area(unittest.TestCase):
         self.assertIsNone(pm.parse_area("A"))
         self.assertIsNone(pm.parse_area("1A"))
         self.assertIsNone(pm.parse_area("A1,B"))
-
-
-if __name__ == '__main__':
-    unittest.main()
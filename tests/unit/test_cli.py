@@ -1,46 +1,42 @@
 #!/usr/bin/env python3
-import json
 import os
-import pathlib
 import subprocess
 import sys
 import tempfile
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+from pagemaker import cli
+from tests._paths import CLI_ENV, FIXTURES, PROJECT_ROOT
 
 
 class TestCLI(unittest.TestCase):
-    def setUp(self):
-        self.fixtures = pathlib.Path(PROJECT_ROOT) / 'tests' / 'fixtures'
-        self.org_basic = self.fixtures / 'basic.org'
+    fixtures = FIXTURES
+    org_basic = FIXTURES / 'basic.org'
 
     def _run(self, args, expect_success=True):
         cmd = [sys.executable, '-m', 'pagemaker.cli'] + args
-        env = os.environ.copy()
-        env['PYTHONPATH'] = SRC_PATH + os.pathsep + env.get('PYTHONPATH', '')
-        res = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+        # Capture raw bytes; output is only decoded when a failure needs reporting
+        res = subprocess.run(cmd, cwd=PROJECT_ROOT, env=CLI_ENV, capture_output=True)
         if expect_success and res.returncode != 0:
-            self.fail(f"Command failed {cmd}\nSTDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}")
+            self.fail(
+                f"Command failed {cmd}\n"
+                f"STDOUT:\n{res.stdout.decode('utf-8', 'replace')}\n"
+                f"STDERR:\n{res.stderr.decode('utf-8', 'replace')}"
+            )
         return res
 
     def test_ir_subcommand(self):
-        res = self._run(['ir', str(self.org_basic)])
-        data = json.loads(res.stdout)
+        # Call the subcommand's IR step in-process; no subprocess or JSON round-trip
+        data = cli.ir_command(str(self.org_basic))
         self.assertIn('pages', data)
         self.assertGreaterEqual(len(data['pages']), 1)
 
     def test_build_subcommand_output(self):
         with tempfile.TemporaryDirectory() as td:
             res = self._run(['build', str(self.org_basic), '--export-dir', td, '-o', 'deck.typ'])
-            self.assertIn('Built Typst', res.stdout)
+            self.assertIn(b'Built Typst', res.stdout)
             self.assertTrue(os.path.exists(os.path.join(td, 'deck.typ')))
 
     def test_validate_subcommand(self):
         res = self._run(['validate', str(self.org_basic)])
-        self.assertIn('IR valid', res.stdout)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        self.assertIn(b'IR valid', res.stdout)
@@ -1,19 +1,14 @@
 #!/usr/bin/env python3
 """Edge case and error handling tests"""
 
-import os
-import sys
 import unittest
-from pathlib import Path
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker as pm
+from tests._paths import FIXTURES
 
 
 class TestEdgeCases(unittest.TestCase):
-    def setUp(self):
-        self.fixtures_path = Path(__file__).parent.parent / "fixtures"
+    fixtures_path = FIXTURES
 
     def test_parse_edge_cases_org(self):
         """Test parsing org file with edge cases"""
@@ -53,7 +48,3 @@ class TestEdgeCases(unittest.TestCase):
         # Should return defaults
         expected = pm.DEFAULTS.copy()
         self.assertEqual(result, expected)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -4,34 +4,47 @@
 Covers:
 - _discover_fonts_in_path: groups files by top-level family directory and totals sizes
 - _collect_real_font_names: extracts real family names from TTF/TTC/OTF via fontTools
+- _collect_real_font_names: reuses the on-disk name cache for unchanged files
+- _collect_real_font_names: prunes cache entries for fonts that no longer exist
+- _get_font_names_cache_path: PAGEMAKER_NO_FONT_CACHE disables the on-disk cache
 - _get_font_paths: includes examples and bundled fonts in expected environments
 """
 
+import json
 import os
 import pathlib
-import sys
+import tempfile
 import unittest
-
-# Ensure src is importable
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
+from unittest import mock
 
 from pagemaker.fonts import (  # noqa: E402
     _collect_real_font_names,
     _discover_fonts_in_path,
+    _get_font_names_cache_path,
     _get_font_paths,
 )
+from tests._paths import PROJECT_ROOT
 
 
 class TestFontHelpers(unittest.TestCase):
     def setUp(self):
-        self.repo_root = pathlib.Path(PROJECT_ROOT).resolve()
+        self.repo_root = PROJECT_ROOT
         self.test_fonts_dir = self.repo_root / 'test' / 'assets' / 'fonts'
         self.examples_fonts_dir = self.repo_root / 'examples' / 'assets' / 'fonts'
         # Bundled fonts live next to the package in src/pagemaker/fonts
         import pagemaker  # noqa: E402
 
         self.bundled_fonts_dir = pathlib.Path(pagemaker.__file__).parent / 'fonts'
+        # Keep the font name cache out of the home directory and empty per test,
+        # so name collection really goes through fontTools
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.cache_path = pathlib.Path(td.name) / 'font_names.json'
+        patcher = mock.patch(
+            'pagemaker.fonts._get_font_names_cache_path', return_value=self.cache_path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_discover_fonts_in_path_groups_by_family(self):
         info = _discover_fonts_in_path(self.test_fonts_dir)
@@ -52,13 +65,45 @@ class TestFontHelpers(unittest.TestCase):
         expected = {'Inter', 'Manrope', 'Playfair Display', 'Fauna One'}
         self.assertTrue(expected.issubset(names))
 
+    def test_collect_real_font_names_reuses_disk_cache(self):
+        try:
+            import fontTools  # noqa: F401
+        except ImportError:
+            self.skipTest("fontTools not available; skipping font name cache test")
+        first = _collect_real_font_names([str(self.bundled_fonts_dir)])
+        self.assertTrue(self.cache_path.exists())
+        # Unchanged files must be served from the cache without re-parsing
+        with mock.patch('pagemaker.fonts._read_font_family_names') as read_names:
+            second = _collect_real_font_names([str(self.bundled_fonts_dir)])
+            read_names.assert_not_called()
+        self.assertIn('Inter', first)
+        self.assertEqual(first, second)
+
+    def test_collect_real_font_names_prunes_missing_files(self):
+        try:
+            import fontTools  # noqa: F401
+        except ImportError:
+            self.skipTest("fontTools not available; skipping font name cache test")
+        gone = str(self.cache_path.parent / 'Gone.ttf')
+        self.cache_path.write_text(
+            json.dumps({gone: {'mtime_ns': 0, 'size': 0, 'names': ['Gone']}}), encoding='utf-8'
+        )
+        names = _collect_real_font_names([str(self.bundled_fonts_dir)])
+        self.assertNotIn('Gone', names)
+        cache = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        self.assertNotIn(gone, cache)
+        self.assertTrue(cache)
+
+    def test_font_cache_opt_out_env(self):
+        # The module-level import is the real function, not the setUp patch
+        with mock.patch.dict(os.environ, {'PAGEMAKER_NO_FONT_CACHE': '1'}):
+            self.assertIsNone(_get_font_names_cache_path())
+        with mock.patch.dict(os.environ, {'PAGEMAKER_NO_FONT_CACHE': '0'}):
+            self.assertEqual(_get_font_names_cache_path().name, 'font_names.json')
+
     def test_get_font_paths_includes_examples_and_bundled(self):
         paths = _get_font_paths()
         # examples assets fonts path should be present in this repo
         self.assertTrue(any('examples/assets/fonts' in p for p in paths))
         # bundled fonts directory should also be present
         self.assertTrue(any(str(self.bundled_fonts_dir) == p for p in paths))
-
-
-if __name__ == '__main__':
-    unittest.main()
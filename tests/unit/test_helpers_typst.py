@@ -1,68 +1,46 @@
 #!/usr/bin/env python3
 """Tests for dynamic helper emissions in Typst output"""
 
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
 import pagemaker as pm
+from tests._typst import assert_all_in
+from tests.unit._ir_factory import single_page_ir
+
+# Empty page with default meta; helpers are emitted regardless of content
+_HELPERS_IR = single_page_ir([], title='P1')
+
+NEEDLES_DYN = (
+    '#let date_iso =',
+    '#let date_yy_mm_dd =',
+    '#let date_dd_mm_yy =',
+    '#let page_no = context counter(page).display()',
+    '#let page_total = context counter(page).final().at(0)',
+)
 
 
 class TestHelpersTypst(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.typst = pm.generate_typst(_HELPERS_IR)
+
     def test_dynamic_helpers_emitted(self):
-        ir = {
-            'meta': {},
-            'pages': [
-                {
-                    'title': 'P1',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 12, 'rows': 8},
-                    'elements': [],
-                }
-            ],
-        }
-        typst = pm.generate_typst(ir)
-        self.assertIn('#let date_iso =', typst)
-        self.assertIn('#let date_yy_mm_dd =', typst)
-        self.assertIn('#let date_dd_mm_yy =', typst)
-        self.assertIn('#let page_no = context counter(page).display()', typst)
-        self.assertIn('#let page_total = context counter(page).final().at(0)', typst)
+        assert_all_in(self.typst, *NEEDLES_DYN)
 
     def test_date_override_and_date(self):
-        ir1 = {
-            'meta': {'DATE_OVERRIDE': '2020-01-02'},
-            'pages': [
-                {
-                    'title': 'P1',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 12, 'rows': 8},
-                    'elements': [],
-                }
-            ],
-        }
+        ir1 = single_page_ir([], {'DATE_OVERRIDE': '2020-01-02'}, title='P1')
         t1 = pm.generate_typst(ir1)
-        self.assertIn('#let date_iso = "2020-01-02"', t1)
-        self.assertIn('#let date_yy_mm_dd = "20.01.02"', t1)
-        self.assertIn('#let date_dd_mm_yy = "02.01.20"', t1)
-        ir2 = {
-            'meta': {'DATE': '2021-12-31'},
-            'pages': [
-                {
-                    'title': 'P1',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 12, 'rows': 8},
-                    'elements': [],
-                }
-            ],
-        }
+        assert_all_in(
+            t1,
+            '#let date_iso = "2020-01-02"',
+            '#let date_yy_mm_dd = "20.01.02"',
+            '#let date_dd_mm_yy = "02.01.20"',
+        )
+        ir2 = single_page_ir([], {'DATE': '2021-12-31'}, title='P1')
         t2 = pm.generate_typst(ir2)
-        self.assertIn('#let date_iso = "2021-12-31"', t2)
-        self.assertIn('#let date_yy_mm_dd = "21.12.31"', t2)
-        self.assertIn('#let date_dd_mm_yy = "31.12.21"', t2)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        assert_all_in(
+            t2,
+            '#let date_iso = "2021-12-31"',
+            '#let date_yy_mm_dd = "21.12.31"',
+            '#let date_dd_mm_yy = "31.12.21"',
+        )
@@ -1,13 +1,8 @@
 #!/usr/bin/env python3
 """Tests for padding parsing and generator emission"""
 
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
 import pagemaker as pm
 from pagemaker.parser import parse_padding
 
@@ -83,7 +78,3 @@ class TestGeneratorPaddedEmission(unittest.TestCase):
         typst = pm.generate_typst(ir)
         self.assertIn("if frame_w < 0mm { frame_w = 0mm }", typst)
         self.assertIn("if frame_h < 0mm { frame_h = 0mm }", typst)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -2,13 +2,10 @@
 """Unit tests for pagemaker API functions"""
 
 import os
-import pathlib
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker as pm
+from tests._paths import FIXTURES, PROJECT_ROOT
 
 
 class TestParseArea(unittest.TestCase):
@@ -21,12 +18,37 @@ class TestParseArea(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestParseOrgString(unittest.TestCase):
+    def test_matches_parse_org_on_disk(self):
+        org_path = FIXTURES / 'basic.org'
+        text = org_path.read_text(encoding='utf-8')
+        self.assertEqual(pm.parse_org_string(text), pm.parse_org(str(org_path)))
+
+    def test_crlf_line_endings(self):
+        text = (FIXTURES / 'basic.org').read_text(encoding='utf-8')
+        crlf = text.replace('\n', '\r\n')
+        self.assertEqual(pm.parse_org_string(crlf), pm.parse_org_string(text))
+
+
 class TestSlugify(unittest.TestCase):
     def test_basic_slugify(self):
         result = pm.slugify("Hello World")
         self.assertEqual(result, "hello-world")
 
 
+class TestMetaDefaults(unittest.TestCase):
+    def test_overrides_merge_over_defaults(self):
+        result = pm.meta_defaults({'GRID': '6x4', 'TITLE': 'ignored'})
+        self.assertEqual(result['GRID'], '6x4')
+        self.assertEqual(result['PAGESIZE'], pm.DEFAULTS['PAGESIZE'])
+        self.assertNotIn('TITLE', result)
+
+    def test_result_is_a_fresh_dict(self):
+        first = pm.meta_defaults({})
+        first['GRID'] = '2x2'
+        self.assertEqual(pm.meta_defaults({})['GRID'], '12x8')
+
+
 class TestEscapeText(unittest.TestCase):
     def test_basic_escape(self):
         result = pm.escape_text("Hello World")
@@ -49,17 +71,12 @@ class TestAdjustAssetPaths(unittest.TestCase):
                 }
             ],
         }
-        export_dir = os.path.join(PROJECT_ROOT, 'export_test_tmp')
-        os.makedirs(export_dir, exist_ok=True)
-        pm.adjust_asset_paths(ir, pathlib.Path(export_dir))
+        # Paths are only computed, never touched, so the export dir need not exist
+        export_dir = PROJECT_ROOT / 'export_test_tmp'
+        pm.adjust_asset_paths(ir, export_dir)
         fig_src = ir['pages'][0]['elements'][0]['figure']['src']
         pdf_src = ir['pages'][0]['elements'][1]['pdf']['src']
-        expected_fig = os.path.relpath(os.path.join(PROJECT_ROOT, 'diagram.png'), export_dir)
-        expected_pdf = os.path.relpath(os.path.join(PROJECT_ROOT, 'spec.pdf'), export_dir)
-        # On most systems export dir is inside project root, so relative path should not start with '/'
+        expected_fig = os.path.relpath(PROJECT_ROOT / 'diagram.png', export_dir)
+        expected_pdf = os.path.relpath(PROJECT_ROOT / 'spec.pdf', export_dir)
         self.assertEqual(fig_src, expected_fig)
         self.assertEqual(pdf_src, expected_pdf)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
 import pagemaker as pm
+from tests._typst import assert_all_in
+
+# Paragraph options STYLE_BODY should carry into #par(...), plus the element's justify override
+PAR_STYLE_NEEDLES = (
+    '#par(',
+    'leading: 1.4em',
+    'spacing: 1em',
+    'first-line-indent: 2em',
+    'hanging-indent: 1em',
+    'linebreaks: loose',
+    'justify: true',
+)
 
 
 class TestParagraphs(unittest.TestCase):
@@ -66,15 +73,5 @@ class TestParagraphs(unittest.TestCase):
         }
         typst = pm.generate_typst(ir)
         # Should emit par(...) with style-driven paragraph options and justify: true (override)
-        self.assertIn('#par(', typst)
-        self.assertIn('leading: 1.4em', typst)
-        self.assertIn('spacing: 1em', typst)
-        self.assertIn('first-line-indent: 2em', typst)
-        self.assertIn('hanging-indent: 1em', typst)
-        self.assertIn('linebreaks: loose', typst)
-        self.assertIn('justify: true', typst)
+        assert_all_in(typst, *PAR_STYLE_NEEDLES)
         self.assertNotIn('justify: false', typst)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -1,4 +1,5 @@
 from pagemaker.generator import generate_typst
+from tests._typst import two_pdf_scales
 
 
 def _page():
@@ -64,9 +65,5 @@ def test_pdf_scale_mode_cover_uses_larger_scale():
     ]
     ir = {'meta': {}, 'pages': [page]}
     typ = generate_typst(ir)
-    import re
-
-    scales = re.findall(r'PdfEmbed\("dummy.pdf", page: 1, scale: ([0-9.]+)\)', typ)
-    assert len(scales) == 2
-    s_contain, s_cover = (float(s) for s in scales)
+    s_contain, s_cover = two_pdf_scales(typ)
     assert s_cover >= s_contain
@@ -1,5 +1,8 @@
+from functools import cache
+
 from pagemaker.generator import generate_typst
 from pagemaker.validation import validate_ir
+from tests._typst import page_contents, two_pdf_scales
 
 
 def _base_page():
@@ -12,287 +15,160 @@ def _base_page():
     }
 
 
-def test_pdf_auto_contain_scale_caps_multiplier():
-    ir = {
-        'meta': {},
-        'pages': [
-            {
-                **_base_page(),
-                'elements': [
-                    {
-                        'id': 'pdf1',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 2, 'h': 2},
-                        'pdf': {
-                            'src': 'dummy.pdf',
-                            'pages': [1],
-                            'scale': 2.0,
-                            # Legacy keys (ignored) should not affect output
-                            'fit': 'contain',
-                            'full_page': True,
-                        },
-                    }
-                ],
-            }
-        ],
+def _pdf_el(el_id, x=1, y=1, w=4, h=4, pdf=None, **extra):
+    """PDF element embedding page 1 of dummy.pdf; ``pdf`` entries merge into the pdf block"""
+    return {
+        'id': el_id,
+        'type': 'pdf',
+        'area': {'x': x, 'y': y, 'w': w, 'h': h},
+        'pdf': {'src': 'dummy.pdf', 'pages': [1], **(pdf or {})},
+        **extra,
+    }
+
+
+def _page_with(page_id, *elements, **extra):
+    """A 4x4-grid A4 page holding elements; ``extra`` overrides or adds page keys"""
+    return {**_base_page(), 'id': page_id, 'elements': list(elements), **extra}
+
+
+def _margins(top, right, bottom, left):
+    return {
+        'margins_mm': {'top': top, 'right': right, 'bottom': bottom, 'left': left},
+        'margins_declared': True,
     }
-    typ = generate_typst(ir)
-    # Should not contain legacy helper or comments
-    assert 'PdfEmbedFit(' not in typ
-    assert 'FULL_PAGE placement' not in typ
+
+
+def _scenario_pages():
+    """One page per generator scenario, keyed by name (page order follows insertion)"""
+    pages = [
+        _page_with(
+            'auto_contain_cap',
+            # Legacy keys (fit, full_page) are ignored and should not affect output
+            _pdf_el('pdf1', w=2, h=2, pdf={'scale': 2.0, 'fit': 'contain', 'full_page': True}),
+        ),
+        # No scale provided => default 1.0 multiplier but auto contain applied
+        _page_with('default_auto_contains', _pdf_el('pdf2', h=2)),
+        # Element padding should reduce available frame and thus lower base scale
+        _page_with(
+            'padding_shrinks_frame',
+            _pdf_el('pdf_pad', padding_mm={'top': 5, 'right': 5, 'bottom': 5, 'left': 5}),
+            _pdf_el('pdf_no_pad'),
+        ),
+        # With margins declared, an element spanning only content tracks should not need +1 columns.
+        # Content grid starts at total index 2; the second element spans the total 6x6 grid.
+        _page_with(
+            'margins_exact_cover',
+            _pdf_el('pdf_content_only', x=2, y=2),
+            _pdf_el('pdf_entire_page', w=6, h=6),
+            title='Margins',
+            **_margins(10, 10, 10, 10),
+        ),
+        # Two identical frames; second has user multiplier 0.5 but scaling is auto-contained and ignores user multiplier.
+        _page_with(
+            'subunit_multiplier_ignored',
+            _pdf_el('pdf_full'),  # implicit multiplier 1.0
+            _pdf_el('pdf_half', pdf={'scale': 0.5}),
+        ),
+        # One element spans full page (including margins) with padding; another without padding.
+        # Padded element should have reduced frame and thus smaller scale.
+        _page_with(
+            'margins_and_padding',
+            _pdf_el('pdf_full_no_pad', w=6, h=6),  # total grid includes margin tracks
+            _pdf_el(
+                'pdf_full_padded',
+                w=6,
+                h=6,
+                padding_mm={'top': 4, 'right': 8, 'bottom': 4, 'left': 8},
+            ),
+            title='MarginsPad',
+            **_margins(12, 15, 12, 15),
+        ),
+    ]
+    return {page['id']: page for page in pages}
+
+
+@cache
+def _generated():
+    """Generate every scenario page in one pass; returns (full typst, {name: page content})"""
+    pages = _scenario_pages()
+    typ = generate_typst({'meta': {}, 'pages': list(pages.values())})
+    contents = page_contents(typ)
+    assert len(contents) == len(pages)
+    return typ, dict(zip(pages, contents))
+
+
+def _page_typ(name):
+    return _generated()[1][name]
+
+
+def test_pdf_auto_contain_scale_caps_multiplier():
+    typ = _page_typ('auto_contain_cap')
+    # Should not contain legacy helper or comments anywhere in the document
+    assert 'PdfEmbedFit(' not in _generated()[0]
+    assert 'FULL_PAGE placement' not in _generated()[0]
     # Auto scale should cap multiplier above containment; scale should be <= 2.0 and not equal to 2.0
     assert 'PdfEmbed("dummy.pdf", page: 1, scale: 2.0)' not in typ
     assert 'PdfEmbed("dummy.pdf", page: 1, scale:' in typ
 
 
 def test_pdf_scale_default_auto_contains():
-    ir = {
-        'meta': {},
-        'pages': [
-            {
-                **_base_page(),
-                'elements': [
-                    {
-                        'id': 'pdf2',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 4, 'h': 2},
-                        'pdf': {
-                            'src': 'dummy.pdf',
-                            'pages': [1],
-                            # No scale provided => default 1.0 multiplier but auto contain applied
-                        },
-                    }
-                ],
-            }
-        ],
-    }
-    typ = generate_typst(ir)
+    typ = _page_typ('default_auto_contains')
     # Expect PdfEmbed with computed auto scale (not necessarily 1.0)
     assert 'PdfEmbed("dummy.pdf", page: 1, scale:' in typ
 
 
 def test_pdf_scale_with_padding_shrinks_frame():
-    # Element padding should reduce available frame and thus lower base scale
-    ir = {
-        'meta': {},
-        'pages': [
-            {
-                **_base_page(),
-                'elements': [
-                    {
-                        'id': 'pdf_pad',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 4, 'h': 4},
-                        'padding_mm': {'top': 5, 'right': 5, 'bottom': 5, 'left': 5},
-                        'pdf': {'src': 'dummy.pdf', 'pages': [1]},
-                    },
-                    {
-                        'id': 'pdf_no_pad',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 4, 'h': 4},
-                        'pdf': {'src': 'dummy.pdf', 'pages': [1]},
-                    },
-                ],
-            }
-        ],
-    }
-    typ = generate_typst(ir)
+    typ = _page_typ('padding_shrinks_frame')
     # Extract scale values
-    import re
-
-    scales = re.findall(r'PdfEmbed\("dummy.pdf", page: 1, scale: ([0-9.]+)\)', typ)
-    assert len(scales) == 2
-    s1, s2 = (float(s) for s in scales)
+    s1, s2 = two_pdf_scales(typ)
     # Padded version should have smaller scale
     assert s1 < s2
 
 
 def test_pdf_scale_with_margins_exact_cover():
-    # With margins declared, an element spanning only content tracks should not need +1 columns
-    ir = {
-        'meta': {},
-        'pages': [
-            {
-                'id': 'p1',
-                'title': 'Margins',
-                'page_size': {'w_mm': 210, 'h_mm': 297},
-                'grid': {'cols': 4, 'rows': 4},
-                'margins_mm': {'top': 10, 'right': 10, 'bottom': 10, 'left': 10},
-                'margins_declared': True,
-                'elements': [
-                    {
-                        'id': 'pdf_content_only',
-                        'type': 'pdf',
-                        # Content grid starts at total index 2 when margins declared; span exactly content area
-                        'area': {'x': 2, 'y': 2, 'w': 4, 'h': 4},
-                        'pdf': {'src': 'dummy.pdf', 'pages': [1]},
-                    },
-                    {
-                        'id': 'pdf_entire_page',
-                        'type': 'pdf',
-                        # Span including margin tracks (total grid 6x6 here)
-                        'area': {'x': 1, 'y': 1, 'w': 6, 'h': 6},
-                        'pdf': {'src': 'dummy.pdf', 'pages': [1]},
-                    },
-                ],
-            }
-        ],
-    }
-    typ = generate_typst(ir)
-    import re
-
-    scales = re.findall(r'PdfEmbed\("dummy.pdf", page: 1, scale: ([0-9.]+)\)', typ)
-    assert len(scales) == 2
-    s_content, s_full = (float(s) for s in scales)
+    typ = _page_typ('margins_exact_cover')
+    s_content, s_full = two_pdf_scales(typ)
     # Full page (including margins) frame larger => its contain scale >= content-only scale
     assert s_full >= s_content
-    ir = {
-        'meta': {},
-        'pages': [
-            {
-                **_base_page(),
-                'elements': [
-                    {
-                        'id': 'pdf2',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 4, 'h': 2},
-                        'pdf': {
-                            'src': 'dummy.pdf',
-                            'pages': [1],
-                            # No scale provided => default 1.0
-                        },
-                    }
-                ],
-            }
-        ],
-    }
-    typ = generate_typst(ir)
-    # Expect PdfEmbed with computed auto scale (not necessarily 1.0)
-    assert 'PdfEmbed("dummy.pdf", page: 1, scale:' in typ
 
 
-def test_validation_errors_for_invalid_pdf_scale():
-    ir = {
-        'meta': {},
-        'pages': [
-            {
-                **_base_page(),
-                'elements': [
-                    {
-                        'id': 'pdf3',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 2, 'h': 2},
-                        'pdf': {
-                            'src': 'dummy.pdf',
-                            'pages': [1],
-                            'scale': 0,  # invalid
-                        },
-                    },
-                    {
-                        'id': 'pdf4',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 2, 'w': 4, 'h': 2},
-                        'pdf': {
-                            'src': 'dummy.pdf',
-                            'pages': [1],
-                            'scale': -1,  # invalid
-                        },
-                    },
-                    {
-                        'id': 'pdf5',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 3, 'w': 4, 'h': 1},
-                        'pdf': {
-                            'src': 'dummy.pdf',
-                            'pages': [1],
-                            'scale': 'big',  # not numeric
-                        },
-                    },
-                ],
-            }
-        ],
-    }
-    result = validate_ir(ir)
-    msgs = {(iss.path, iss.message) for iss in result.issues}
-    assert ('/pages/0/elements/0/pdf/scale', 'PDF scale must be > 0') in msgs
-    assert ('/pages/0/elements/1/pdf/scale', 'PDF scale must be > 0') in msgs
-    assert ('/pages/0/elements/2/pdf/scale', 'PDF scale must be a number') in msgs
+def _invalid_scale_ir():
+    page = _page_with(
+        'p1',
+        _pdf_el('pdf3', w=2, h=2, pdf={'scale': 0}),  # invalid
+        _pdf_el('pdf4', y=2, h=2, pdf={'scale': -1}),  # invalid
+        _pdf_el('pdf5', y=3, h=1, pdf={'scale': 'big'}),  # not numeric
+    )
+    return {'meta': {}, 'pages': [page]}
 
 
-def test_pdf_scale_with_subunit_multiplier_is_ignored():
-    # Two identical frames; second has user multiplier 0.5 but scaling is auto-contained and ignores user multiplier.
-    ir = {
-        'meta': {},
-        'pages': [
-            {
-                **_base_page(),
-                'elements': [
-                    {
-                        'id': 'pdf_full',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 4, 'h': 4},
-                        'pdf': {'src': 'dummy.pdf', 'pages': [1]},  # implicit multiplier 1.0
-                    },
-                    {
-                        'id': 'pdf_half',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 4, 'h': 4},
-                        'pdf': {'src': 'dummy.pdf', 'pages': [1], 'scale': 0.5},
-                    },
-                ],
-            }
-        ],
-    }
-    typ = generate_typst(ir)
-    import re
+@cache
+def _scale_issues():
+    """Validate the invalid-scale IR once; returns frozenset of (path, message)"""
+    result = validate_ir(_invalid_scale_ir())
+    return frozenset((iss.path, iss.message) for iss in result.issues)
+
+
+def test_validation_error_for_zero_pdf_scale():
+    assert ('/pages/0/elements/0/pdf/scale', 'PDF scale must be > 0') in _scale_issues()
 
-    scales = re.findall(r'PdfEmbed\("dummy.pdf", page: 1, scale: ([0-9.]+)\)', typ)
-    assert len(scales) == 2
-    s_full, s_half = (float(s) for s in scales)
+
+def test_validation_error_for_negative_pdf_scale():
+    assert ('/pages/0/elements/1/pdf/scale', 'PDF scale must be > 0') in _scale_issues()
+
+
+def test_validation_error_for_non_numeric_pdf_scale():
+    assert ('/pages/0/elements/2/pdf/scale', 'PDF scale must be a number') in _scale_issues()
+
+
+def test_pdf_scale_with_subunit_multiplier_is_ignored():
+    typ = _page_typ('subunit_multiplier_ignored')
+    s_full, s_half = two_pdf_scales(typ)
     # User multiplier 0.5 ignored => scales equal (allow tiny formatting diff)
     assert abs(s_full - s_half) < 1e-9
 
 
 def test_pdf_scale_with_margins_and_padding_combined():
-    # One element spans full page (including margins) with padding; another without padding.
-    # Padded element should have reduced frame and thus smaller scale.
-    ir = {
-        'meta': {},
-        'pages': [
-            {
-                'id': 'p1',
-                'title': 'MarginsPad',
-                'page_size': {'w_mm': 210, 'h_mm': 297},
-                'grid': {'cols': 4, 'rows': 4},
-                'margins_mm': {'top': 12, 'right': 15, 'bottom': 12, 'left': 15},
-                'margins_declared': True,
-                'elements': [
-                    {
-                        'id': 'pdf_full_no_pad',
-                        'type': 'pdf',
-                        'area': {
-                            'x': 1,
-                            'y': 1,
-                            'w': 6,
-                            'h': 6,
-                        },  # total grid includes margin tracks
-                        'pdf': {'src': 'dummy.pdf', 'pages': [1]},
-                    },
-                    {
-                        'id': 'pdf_full_padded',
-                        'type': 'pdf',
-                        'area': {'x': 1, 'y': 1, 'w': 6, 'h': 6},
-                        'padding_mm': {'top': 4, 'right': 8, 'bottom': 4, 'left': 8},
-                        'pdf': {'src': 'dummy.pdf', 'pages': [1]},
-                    },
-                ],
-            }
-        ],
-    }
-    typ = generate_typst(ir)
-    import re
-
-    scales = re.findall(r'PdfEmbed\("dummy.pdf", page: 1, scale: ([0-9.]+)\)', typ)
-    assert len(scales) == 2
-    s_no_pad, s_padded = (float(s) for s in scales)
+    typ = _page_typ('margins_and_padding')
+    s_no_pad, s_padded = two_pdf_scales(typ)
     assert s_padded < s_no_pad
@@ -1,13 +1,8 @@
 #!/usr/bin/env python3
 """Ensure minimal ColorRect form when no stroke/radius provided"""
 
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
 import pagemaker as pm
 
 
@@ -37,7 +32,3 @@ class TestRectangleMinimalColorRect(unittest.TestCase):
         self.assertIn('ColorRect("#00ff00", 0.75)', typst)
         # Specifically ensure the placed element uses the minimal call without optional args
         self.assertIn('#layer_grid(gp,1,1,2,2, ColorRect("#00ff00", 0.75))', typst)
-
-
-if __name__ == '__main__':
-    unittest.main()
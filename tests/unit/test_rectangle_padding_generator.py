@@ -1,38 +1,34 @@
 #!/usr/bin/env python3
 """Tests for rectangle padding handling in generator"""
 
-import os
-import sys
 import unittest
-
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
+from types import MappingProxyType
 
 import pagemaker as pm
 
+# Read-only page and rectangle templates; make_ir only builds the containers around them
+_PAGE_TEMPLATE = MappingProxyType(
+    {
+        'title': 'RectPad',
+        'page_size': MappingProxyType({'w_mm': 210.0, 'h_mm': 297.0}),
+        'grid': MappingProxyType({'cols': 6, 'rows': 6}),
+    }
+)
+_RECT_TEMPLATE = MappingProxyType(
+    {
+        'id': 'rect1',
+        'type': 'rectangle',
+        'area': MappingProxyType({'x': 2, 'y': 2, 'w': 3, 'h': 2}),
+        'z': 1,
+        'rectangle': MappingProxyType({'color': '#ff0000', 'alpha': 0.5}),
+    }
+)
+
 
 class TestRectanglePaddingEmission(unittest.TestCase):
     def make_ir(self, pad=None):
-        return {
-            'meta': {},
-            'pages': [
-                {
-                    'title': 'RectPad',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 6, 'rows': 6},
-                    'elements': [
-                        {
-                            'id': 'rect1',
-                            'type': 'rectangle',
-                            'area': {'x': 2, 'y': 2, 'w': 3, 'h': 2},
-                            'z': 1,
-                            'rectangle': {'color': '#ff0000', 'alpha': 0.5},
-                            'padding_mm': pad,
-                        }
-                    ],
-                }
-            ],
-        }
+        element = {**_RECT_TEMPLATE, 'padding_mm': pad}
+        return {'meta': {}, 'pages': [{**_PAGE_TEMPLATE, 'elements': [element]}]}
 
     def test_rectangle_emits_layer_grid_padded_when_padding_present(self):
         pad = {"top": 4.0, "right": 3.0, "bottom": 2.0, "left": 1.0}
@@ -50,7 +46,3 @@ class TestRectanglePaddingEmission(unittest.TestCase):
         typst = pm.generate_typst(ir)
         self.assertIn("#layer_grid(gp,2,2,3,2", typst)
         self.assertIn("ColorRect(\"#ff0000\", 0.5)", typst)
-
-
-if __name__ == '__main__':
-    unittest.main()
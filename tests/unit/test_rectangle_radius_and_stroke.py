@@ -1,107 +1,65 @@
 #!/usr/bin/env python3
 """Tests for rectangle radius emission and stroke fallback behavior."""
 
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker as pm
+from tests.unit._ir_factory import single_page_ir
+
+# One rectangle per grid row so a single generator pass covers every case
+_RECTS = {
+    'radius_only': {'color': '#101010', 'alpha': 0.75, 'radius': '5mm'},
+    'radius_with_stroke': {
+        'color': '#222222',
+        'alpha': 0.5,
+        'stroke': '2pt',
+        'stroke_color': '#333333',
+        'radius': '3pt',
+    },
+    # stroke provided but no stroke_color => fallback to fill color
+    'stroke_fallback': {'color': '#abcdef', 'alpha': 1.0, 'stroke': '1pt', 'radius': '2mm'},
+}
+_ROWS = {name: row for row, name in enumerate(_RECTS, start=1)}
+
+
+def _make_ir():
+    elements = [
+        {
+            'id': f'rect_{name}',
+            'type': 'rectangle',
+            'area': {'x': 1, 'y': _ROWS[name], 'w': 1, 'h': 1},
+            'z': 1,
+            'rectangle': rect,
+        }
+        for name, rect in _RECTS.items()
+    ]
+    return single_page_ir(elements, cols=4, rows=len(_RECTS), title='RadiusStroke')
 
 
 class TestRectangleRadiusAndStroke(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.typst = pm.generate_typst(_make_ir())
+
+    def assertColorRect(self, name, call):
+        self.assertIn(f'#layer_grid(gp,1,{_ROWS[name]},1,1, {call})', self.typst)
+
     def test_radius_only_emits_radius_argument(self):
-        ir = {
-            'meta': {},
-            'pages': [
-                {
-                    'title': 'RadiusOnly',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 4, 'rows': 4},
-                    'elements': [
-                        {
-                            'id': 'r1',
-                            'type': 'rectangle',
-                            'area': {'x': 1, 'y': 1, 'w': 2, 'h': 2},
-                            'z': 1,
-                            'rectangle': {'color': '#101010', 'alpha': 0.75, 'radius': '5mm'},
-                        }
-                    ],
-                }
-            ],
-        }
-        typst = pm.generate_typst(ir)
         # Expect stroke: none placeholders when only radius provided
-        self.assertIn(
-            'ColorRect("#101010", 0.75, stroke: none, stroke_color: none, radius: 5mm)', typst
+        self.assertColorRect(
+            'radius_only',
+            'ColorRect("#101010", 0.75, stroke: none, stroke_color: none, radius: 5mm)',
         )
 
     def test_radius_with_stroke(self):
-        ir = {
-            'meta': {},
-            'pages': [
-                {
-                    'title': 'RadiusStroke',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 4, 'rows': 4},
-                    'elements': [
-                        {
-                            'id': 'r2',
-                            'type': 'rectangle',
-                            'area': {'x': 2, 'y': 2, 'w': 2, 'h': 2},
-                            'z': 1,
-                            'rectangle': {
-                                'color': '#222222',
-                                'alpha': 0.5,
-                                'stroke': '2pt',
-                                'stroke_color': '#333333',
-                                'radius': '3pt',
-                            },
-                        }
-                    ],
-                }
-            ],
-        }
-        typst = pm.generate_typst(ir)
-        self.assertIn(
+        self.assertColorRect(
+            'radius_with_stroke',
             'ColorRect("#222222", 0.5, stroke: 2pt, stroke_color: "#333333", radius: 3pt)',
-            typst,
         )
 
     def test_stroke_color_fallback_to_fill(self):
-        # stroke provided but no stroke_color => fallback to fill color
-        ir = {
-            'meta': {},
-            'pages': [
-                {
-                    'title': 'StrokeFallback',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 4, 'rows': 4},
-                    'elements': [
-                        {
-                            'id': 'r3',
-                            'type': 'rectangle',
-                            'area': {'x': 1, 'y': 1, 'w': 2, 'h': 2},
-                            'z': 1,
-                            'rectangle': {
-                                'color': '#abcdef',
-                                'alpha': 1.0,
-                                'stroke': '1pt',
-                                'radius': '2mm',
-                            },
-                        }
-                    ],
-                }
-            ],
-        }
-        typst = pm.generate_typst(ir)
         # Expect stroke_color equals fill color (#abcdef)
-        self.assertIn(
+        self.assertColorRect(
+            'stroke_fallback',
             'ColorRect("#abcdef", 1.0, stroke: 1pt, stroke_color: "#abcdef", radius: 2mm)',
-            typst,
         )
-
-
-if __name__ == '__main__':
-    unittest.main()
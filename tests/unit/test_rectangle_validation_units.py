@@ -1,69 +1,59 @@
 #!/usr/bin/env python3
 """Tests validating stroke and radius unit errors at style and element levels."""
 
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker.validation as pv
 
+# (case name, meta, rectangle dict or None, substrings expected among error messages)
+CASES = [
+    (
+        'style',
+        {'STYLE_BAD': 'color: #000, stroke: 5, radius: 10'},  # missing units
+        None,
+        ('stroke', 'radius'),
+    ),
+    (
+        'element',
+        {},
+        {'color': '#333333', 'alpha': 0.5, 'stroke': '2', 'radius': '4'},  # missing units
+        ('Stroke length', 'Radius length'),
+    ),
+]
 
-class TestRectangleValidationUnits(unittest.TestCase):
-    def test_invalid_style_stroke_and_radius_units(self):
-        ir = {
-            'meta': {
-                'STYLE_BAD': 'color: #000, stroke: 5, radius: 10',  # missing units
-            },
-            'pages': [
-                {
-                    'id': 'p1',
-                    'title': 'Page',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 1, 'rows': 1},
-                    'elements': [],
-                }
-            ],
-        }
-        res = pv.validate_ir(ir)
-        msgs = [i.message for i in res.issues if i.severity == 'error']
-        self.assertTrue(any('stroke' in m for m in msgs))
-        self.assertTrue(any('radius' in m for m in msgs))
-        self.assertFalse(res.ok())
 
-    def test_invalid_element_stroke_and_radius_units(self):
-        ir = {
-            'meta': {},
-            'pages': [
-                {
-                    'id': 'p1',
-                    'title': 'Page',
-                    'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
-                    'grid': {'cols': 2, 'rows': 2},
-                    'elements': [
-                        {
-                            'id': 'r1',
-                            'type': 'rectangle',
-                            'area': {'x': 1, 'y': 1, 'w': 1, 'h': 1},
-                            'z': 1,
-                            'rectangle': {
-                                'color': '#333333',
-                                'alpha': 0.5,
-                                'stroke': '2',
-                                'radius': '4',
-                            },  # missing units
-                        }
-                    ],
-                }
-            ],
-        }
-        res = pv.validate_ir(ir)
-        msgs = [i.message for i in res.issues if i.severity == 'error']
-        self.assertTrue(any('Stroke length' in m for m in msgs))
-        self.assertTrue(any('Radius length' in m for m in msgs))
-        self.assertFalse(res.ok())
+def _mk_ir(meta, rect):
+    elements = []
+    if rect is not None:
+        elements.append(
+            {
+                'id': 'r1',
+                'type': 'rectangle',
+                'area': {'x': 1, 'y': 1, 'w': 1, 'h': 1},
+                'z': 1,
+                'rectangle': rect,
+            }
+        )
+    return {
+        'meta': meta,
+        'pages': [
+            {
+                'id': 'p1',
+                'title': 'Page',
+                'page_size': {'w_mm': 210.0, 'h_mm': 297.0},
+                'grid': {'cols': 2, 'rows': 2},
+                'elements': elements,
+            }
+        ],
+    }
 
 
-if __name__ == '__main__':
-    unittest.main()
+class TestRectangleValidationUnits(unittest.TestCase):
+    def test_invalid_stroke_and_radius_units(self):
+        for name, meta, rect, keywords in CASES:
+            with self.subTest(case=name):
+                res = pv.validate_ir(_mk_ir(meta, rect))
+                msgs = [i.message for i in res.issues if i.severity == 'error']
+                for keyword in keywords:
+                    self.assertTrue(any(keyword in m for m in msgs), keyword)
+                self.assertFalse(res.ok())
@@ -1,10 +1,6 @@
 #!/usr/bin/env python3
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker as pm
 
 
@@ -48,7 +44,3 @@ class TestSingleTypstPageSetting(unittest.TestCase):
         t = pm.generate_typst(ir)
         # Ensure exactly one document-level page setting is emitted
         self.assertEqual(t.count('#set page('), 1, msg=t)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 import os
-import pathlib
-import sys
-import tempfile
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
 import pagemaker as pm
 from pagemaker.validation import validate_ir
+from tests._paths import PROJECT_ROOT
 
 
 class TestSVGAndMargins(unittest.TestCase):
@@ -29,12 +25,11 @@ class TestSVGAndMargins(unittest.TestCase):
                 }
             ],
         }
-        with tempfile.TemporaryDirectory() as td:
-            export_dir = pathlib.Path(td)
-            pm.adjust_asset_paths(ir, export_dir)
-            ssrc = ir['pages'][0]['elements'][0]['svg']['src']
-            self.assertFalse(os.path.isabs(ssrc))
-            self.assertIn('assets', ssrc)
+        # Paths are only computed, never touched, so the export dir need not exist
+        pm.adjust_asset_paths(ir, PROJECT_ROOT / 'export_test_tmp')
+        ssrc = ir['pages'][0]['elements'][0]['svg']['src']
+        self.assertFalse(os.path.isabs(ssrc))
+        self.assertIn('assets', ssrc)
 
     def test_validation_svg_missing_asset_strict(self):
         ir = {
@@ -64,14 +59,6 @@ class TestSVGAndMargins(unittest.TestCase):
 
     def test_margins_expand_grid_total(self):
         org = """#+GRID: 12x8\n#+MARGINS: 5,5,5,5\n\n* P\n:PROPERTIES:\n:ID: p\n:END:\n\n** B\n:PROPERTIES:\n:TYPE: body\n:AREA: A1,A1\n:END:\n"""
-        with tempfile.TemporaryDirectory() as td:
-            org_path = pathlib.Path(td) / 'm.org'
-            org_path.write_text(org, encoding='utf-8')
-            ir = pm.parse_org(str(org_path))
-            page = ir['pages'][0]
-            self.assertEqual(page['grid_total']['cols'], 12 + 2)
-            self.assertEqual(page['grid_total']['rows'], 8 + 2)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        page = pm.parse_org_string(org)['pages'][0]
+        self.assertEqual(page['grid_total']['cols'], 12 + 2)
+        self.assertEqual(page['grid_total']['rows'], 8 + 2)
@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 """Unit tests for Typst table rendering"""
 
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
 import pagemaker.generator as gen
+from tests._typst import assert_all_in
+
+BASIC_NEEDLES = (
+    # One Typst table with columns and gutter
+    '#table(columns: (auto, auto), gutter: 6pt',
+    # Header section present; no implicit top hline
+    'table.header(',
+    # Header cells are bolded
+    '#strong[Col A]',
+    '#strong[Col B]',
+)
+# Data cells are not bolded
+BASIC_ABSENT = ('#strong[a1]', '#strong[b1]')
 
 
 class TestTableRendering(unittest.TestCase):
@@ -22,16 +30,8 @@ class TestTableRendering(unittest.TestCase):
             'header_rows': 1,
         }
         out = gen._render_table_block(table, 'font: "Inter"')
-        # One Typst table with columns and gutter
-        self.assertIn('#table(columns: (auto, auto), gutter: 6pt', out)
-        # Header section present; no implicit top hline
-        self.assertIn('table.header(', out)
-        # Header cells are bolded
-        self.assertIn('#strong[Col A]', out)
-        self.assertIn('#strong[Col B]', out)
-        # Data cells are not bolded
-        self.assertNotIn('#strong[a1]', out)
-        self.assertNotIn('#strong[b1]', out)
+        assert_all_in(out, *BASIC_NEEDLES)
+        self.assertEqual([n for n in BASIC_ABSENT if n in out], [])
         # Horizontal lines only at explicit separators; none provided here
         self.assertEqual(out.count('table.hline()'), 0)
 
@@ -111,7 +111,3 @@ class TestTableRendering(unittest.TestCase):
         out = gen._render_table_block(table, 'font: "Inter"')
         # Only the natural boundary between the two rows should be present
         self.assertEqual(out.count('table.hline()'), 1)
-
-
-if __name__ == '__main__':
-    unittest.main()
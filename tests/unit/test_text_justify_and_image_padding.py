@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """Tests for JUSTIFY toggle on text and padding on images/PDF/SVG"""
 
-import os
-import sys
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
 import pagemaker as pm
+from tests._typst import assert_all_in
+
+# Padded placement prefix expected for the figure, SVG and PDF elements (padding 1,2,3,4 mm)
+PADDED_PLACEMENTS = (
+    '#layer_grid_padded(gp,1,1,3,2, 1.0mm, 2.0mm, 3.0mm, 4.0mm, Fig(',
+    '#layer_grid_padded(gp,4,1,3,2, 1.0mm, 2.0mm, 3.0mm, 4.0mm, Fig(',
+    '#layer_grid_padded(gp,7,1,3,2, 1.0mm, 2.0mm, 3.0mm, 4.0mm, PdfEmbed(',
+)
 
 
 class TestTextJustifyAndImagePadding(unittest.TestCase):
@@ -93,10 +96,5 @@ class TestTextJustifyAndImagePadding(unittest.TestCase):
             ],
         }
         typst = pm.generate_typst(ir)
-        # All three should use the padded placement
-        self.assertGreaterEqual(typst.count('#layer_grid_padded'), 3)
-        self.assertIn(' 1.0mm, 2.0mm, 3.0mm, 4.0mm', typst)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        # All three should use the padded placement with the element padding
+        assert_all_in(typst, *PADDED_PLACEMENTS)
@@ -1,21 +1,12 @@
 #!/usr/bin/env python3
 """Tests for TOC element parsing and generation"""
 
-import os
-import pathlib
-import sys
-import tempfile
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
-
 import pagemaker as pm
 
-
-class TestTocElement(unittest.TestCase):
-    def test_parser_accepts_toc_type(self):
-        org = """#+TITLE: TOC Test
+# One slide with a TOC element next to a body element
+_ORG_TOC = """#+TITLE: TOC Test
 
 * Slide 1
 :PROPERTIES:
@@ -35,13 +26,14 @@ class TestTocElement(unittest.TestCase):
 :END:
 Content
 """
-        with tempfile.TemporaryDirectory() as td:
-            p = pathlib.Path(td) / 'toc.org'
-            p.write_text(org, encoding='utf-8')
-            ir = pm.parse_org(str(p))
-            els = ir['pages'][0]['elements']
-            types = [e['type'] for e in els]
-            self.assertIn('toc', types)
+
+
+class TestTocElement(unittest.TestCase):
+    def test_parser_accepts_toc_type(self):
+        ir = pm.parse_org_string(_ORG_TOC)
+        els = ir['pages'][0]['elements']
+        types = [e['type'] for e in els]
+        self.assertIn('toc', types)
 
     def test_generator_emits_bulleted_titles(self):
         ir = {
@@ -83,7 +75,3 @@ Content
         self.assertIn('[#text(font: "Inter")[2]])', typst)
         # Ensure the element is placed via layer_grid
         self.assertIn('#layer_grid(gp,1,1,2,2, ', typst)
-
-
-if __name__ == '__main__':
-    unittest.main()
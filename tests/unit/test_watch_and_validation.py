@@ -1,63 +1,43 @@
 #!/usr/bin/env python3
-import os
+import contextlib
+import io
 import pathlib
 import subprocess
-import sys
 import tempfile
+import traceback
 import unittest
 
-PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
-SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+from pagemaker import cli
+from tests._paths import FIXTURES
 
-
-class TestWatchAndValidation(unittest.TestCase):
-    def setUp(self):
-        self.fixtures = pathlib.Path(PROJECT_ROOT) / 'tests' / 'fixtures'
-        self.org_basic = self.fixtures / 'basic.org'
-
-    def _run_cli(self, args, expect_success=True):
-        cmd = [sys.executable, '-m', 'pagemaker.cli'] + args
-        env = os.environ.copy()
-        env['PYTHONPATH'] = SRC_PATH + os.pathsep + env.get('PYTHONPATH', '')
-        res = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
-        if expect_success and res.returncode != 0:
-            self.fail(f"Command failed {cmd}\nSTDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}")
-        return res
-
-    def test_watch_once_builds(self):
-        with tempfile.TemporaryDirectory() as td:
-            tmp_org = pathlib.Path(td) / 'deck.org'
-            tmp_org.write_text(self.org_basic.read_text(encoding='utf-8'), encoding='utf-8')
-            res = self._run_cli(['watch', str(tmp_org), '--once', '--export-dir', td])
-            self.assertIn('[watch] Rebuilt Typst', res.stdout)
-            self.assertTrue((pathlib.Path(td) / 'deck.typ').exists())
-
-    def test_validation_duplicate_ids(self):
-        # Construct minimal IR by writing org with duplicate headlines
-        org_content = """* Page One\n** Element\n:PROPERTIES:\n:TYPE: header\n:END:\n** Element\n:PROPERTIES:\n:TYPE: header\n:END:\n"""
-        with tempfile.TemporaryDirectory() as td:
-            org_file = pathlib.Path(td) / 'dup.org'
-            org_file.write_text(org_content, encoding='utf-8')
-            res = self._run_cli(['validate', str(org_file)], expect_success=False)
-            self.assertIn('Duplicate element id', res.stdout + res.stderr)
-
-    def test_validation_alpha_out_of_range(self):
-        org_content = """* Page
+# Triggers three validators in one document: duplicate element ids (error), alpha
+# out of range (warning) and a missing figure asset (warning, or error with
+# --strict-assets)
+_ORG_ALL_VALIDATORS = """* Page
+** Element
+:PROPERTIES:
+:TYPE: header
+:END:
+** Element
+:PROPERTIES:
+:TYPE: header
+:END:
 ** Rect
 :PROPERTIES:
 :TYPE: rectangle
 :AREA: 1,1,2,2
 :ALPHA: 1.5
 :END:
+** Img
+:PROPERTIES:
+:TYPE: figure
+:AREA: 1,1,2,2
+:END:
+[[file:nonexistent_dir/nonexistent.png]]
 """
-        with tempfile.TemporaryDirectory() as td:
-            org_file = pathlib.Path(td) / 'alpha.org'
-            org_file.write_text(org_content, encoding='utf-8')
-            res = self._run_cli(['validate', str(org_file)], expect_success=False)
-            self.assertIn('Alpha out of range', res.stdout + res.stderr)
 
-    def test_validation_missing_asset_warning(self):
-        org_content = """* Page
+# Missing figure asset on its own: a warning must not fail lenient validation
+_ORG_MISSING_ASSET = """* Page
  ** Img
  :PROPERTIES:
  :TYPE: figure
@@ -65,30 +45,88 @@ class TestWatchAndValidation(unittest.TestCase):
  :END:
  [[file:nonexistent_dir/nonexistent.png]]
  """
-        with tempfile.TemporaryDirectory() as td:
-            org_file = pathlib.Path(td) / 'missing_asset.org'
-            org_file.write_text(org_content, encoding='utf-8')
-            res = self._run_cli(['validate', str(org_file)], expect_success=True)
-            # Should be a warning not an error
-            self.assertIn('Figure asset not found', res.stdout + res.stderr)
 
-    def test_validation_missing_asset_strict_error(self):
-        org_content = """* Page
- ** Img
- :PROPERTIES:
- :TYPE: figure
- :AREA: 1,1,2,2
- :END:
- [[file:nonexistent_dir/nonexistent.png]]
- """
-        with tempfile.TemporaryDirectory() as td:
-            org_file = pathlib.Path(td) / 'missing_asset_strict.org'
-            org_file.write_text(org_content, encoding='utf-8')
-            res = self._run_cli(
-                ['validate', '--strict-assets', str(org_file)], expect_success=False
-            )
-            self.assertIn('Figure asset not found', res.stdout + res.stderr)
 
+def _invoke_cli(args):
+    """Run ``pagemaker.cli.main(args)`` in-process, capturing output like a subprocess"""
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            cli.main(args)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception:
+            # Uncaught errors exit 1 with a traceback on stderr, as in a real process
+            traceback.print_exc()
+            returncode = 1
+    return subprocess.CompletedProcess(args, returncode, out.getvalue(), err.getvalue())
+
+
+class TestWatchAndValidation(unittest.TestCase):
+    fixtures = FIXTURES
+    org_basic = FIXTURES / 'basic.org'
+
+    @classmethod
+    def setUpClass(cls):
+        # One scratch directory for the whole class; each test writes distinct file names
+        cls._td = tempfile.TemporaryDirectory()
+        cls.td_path = pathlib.Path(cls._td.name)
+        # Validate the all-validators document once per mode; tests share the results
+        all_org = cls.td_path / 'all_validators.org'
+        all_org.write_text(_ORG_ALL_VALIDATORS, encoding='utf-8')
+        cls.lenient = _invoke_cli(['validate', str(all_org)])
+        cls.strict = _invoke_cli(['validate', '--strict-assets', str(all_org)])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._td.cleanup()
+
+    def _write_org(self, name, text):
+        org_file = self.td_path / name
+        org_file.write_text(text, encoding='utf-8')
+        return org_file
+
+    def _run_cli(self, args, expect_success=True):
+        res = _invoke_cli(args)
+        if expect_success and res.returncode != 0:
+            self.fail(f"Command failed {args}\nSTDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}")
+        return res
+
+    def test_watch_once_builds(self):
+        # watch only reads the Org file, so it can watch the fixture in place
+        export_dir = self.td_path / 'watch_export'
+        res = self._run_cli(
+            ['watch', str(self.org_basic), '--once', '--export-dir', str(export_dir)]
+        )
+        self.assertIn('[watch] Rebuilt Typst', res.stdout)
+        self.assertTrue((export_dir / 'deck.typ').exists())
+
+    def _assertIssue(self, res, line_prefix, message):
+        lines = (res.stdout + res.stderr).splitlines()
+        self.assertTrue(
+            any(ln.startswith(line_prefix) and message in ln for ln in lines),
+            f"No '{line_prefix}...{message}' line in:\n{res.stdout}{res.stderr}",
+        )
+
+    def test_validation_duplicate_ids(self):
+        self.assertNotEqual(self.lenient.returncode, 0)
+        self._assertIssue(self.lenient, 'ERROR:', 'Duplicate element id')
+
+    def test_validation_alpha_out_of_range(self):
+        self._assertIssue(self.lenient, 'WARN:', 'Alpha out of range')
 
-if __name__ == '__main__':
-    unittest.main()
+    def test_validation_missing_asset_warning(self):
+        # Should be a warning not an error
+        self._assertIssue(self.lenient, 'WARN:', 'Figure asset not found')
+        org_file = self._write_org('missing_asset.org', _ORG_MISSING_ASSET)
+        res = self._run_cli(['validate', str(org_file)], expect_success=True)
+        self.assertIn('Figure asset not found', res.stdout + res.stderr)
+
+    def test_validation_missing_asset_strict_error(self):
+        self._assertIssue(self.strict, 'ERROR:', 'Figure asset not found')
+        # The shared document already fails on its duplicate ids; the missing asset
+        # alone must be enough to fail strict validation
+        org_file = self._write_org('missing_asset_strict.org', _ORG_MISSING_ASSET)
+        res = self._run_cli(['validate', '--strict-assets', str(org_file)], expect_success=False)
+        self.assertNotEqual(res.returncode, 0)